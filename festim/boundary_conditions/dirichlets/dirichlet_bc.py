@@ -78,7 +78,7 @@ class DirichletBC(BoundaryCondition):
         self.dirichlet_bc = []
         self.create_expression(T)
         # TODO: this should be more generic
-        mobile_fields = [0, "0", "solute"]
+        mobile_fields = {0, "0", "solute"}
         if self.field in mobile_fields and chemical_pot:
             self.normalise_by_solubility(materials, volume_markers, T)
 
@@ -144,17 +144,28 @@ class BoundaryConditionExpression(f.UserExpression):
         self.eval_function = eval_function
         self.prms = kwargs
 
-    def eval(self, value, x):
-        # find local value of parameters
-        new_prms = {}
-        for key, prm_val in self.prms.items():
+        # classify the parameters once at construction: eval() is called at
+        # every evaluation point so the callable/Constant checks shouldn't be
+        # repeated there
+        self._plain_prms = {}
+        self._constant_prms = []
+        self._callable_prms = []
+        for key, prm_val in kwargs.items():
             if callable(prm_val):
                 if isinstance(prm_val, f.Constant):
-                    new_prms[key] = float(prm_val)
+                    self._constant_prms.append(key)
                 else:
-                    new_prms[key] = prm_val(x)
+                    self._callable_prms.append(key)
             else:
-                new_prms[key] = prm_val
+                self._plain_prms[key] = prm_val
+
+    def eval(self, value, x):
+        # find local value of parameters
+        new_prms = dict(self._plain_prms)
+        for key in self._constant_prms:
+            new_prms[key] = float(self.prms[key])
+        for key in self._callable_prms:
+            new_prms[key] = self.prms[key](x)
 
         # evaluate at local point
         value[0] = self.eval_function(self._T(x), **new_prms)
@@ -43,6 +43,9 @@ class Mobile(Concentration):
                 to False.
         """
         self.F = 0
+        # reset the expressions so that rebuilding the form doesn't
+        # accumulate stale ones
+        self.sub_expressions = []
         self.create_diffusion_form(materials, mesh, T, dt=dt, traps=traps, soret=soret)
         self.create_source_form(mesh.dx)
         self.create_fluxes_form(T, mesh.ds, dt)
@@ -142,6 +145,7 @@ class Mobile(Concentration):
         F_trapping = 0
         if traps is not None:
             for trap in traps:
+                trap.make_kinetic_constants()
                 for i, mat in enumerate(trap.materials):
                     if type(trap.k_0) is list:
                         k_0 = trap.k_0[i]
@@ -1,4 +1,4 @@
-from festim import Concentration, k_B, Material, Theta, RadioactiveDecay
+from festim import Concentration, k_B, Material, Theta, RadioactiveDecay, as_constant
 from fenics import *
 import sympy as sp
 
@@ -84,6 +84,24 @@ class Trap(Concentration):
         if len(self.materials) != len(list(set(self.materials))):
             raise ValueError("Duplicate materials in trap")
 
+    def make_kinetic_constants(self):
+        """Wraps the kinetic parameters (k_0, E_k, p_0, E_p) in
+        fenics.Constant objects. Traps differing only by their parameter
+        values then produce forms with the same signature, so a single
+        compiled form is shared between them. The constants can also be
+        assigned new values (e.g. for parameter sweeps) without rebuilding
+        the forms.
+        """
+        for attr in ("k_0", "E_k", "p_0", "E_p"):
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                value = [
+                    as_constant(v) if isinstance(v, (int, float)) else v for v in value
+                ]
+            elif isinstance(value, (int, float)):
+                value = as_constant(value)
+            setattr(self, attr, value)
+
     def make_density(self, densities):
         if type(densities) is not list:
             densities = [densities]
@@ -118,6 +136,9 @@ class Trap(Concentration):
                 Defaults to None.
         """
         self.F = 0
+        # reset the expressions so that rebuilding the form doesn't
+        # accumulate stale ones
+        self.sub_expressions = []
         self.create_trapping_form(mobile, materials, T, dx, dt)
         if self.sources is not None:
             self.create_source_form(dx)
@@ -140,6 +161,8 @@ class Trap(Concentration):
         if not all(isinstance(mat, Material) for mat in self.materials):
             self.make_materials(materials)
 
+        self.make_kinetic_constants()
+
         expressions_trap = []
         F_trapping = 0  # initialise the form
 
@@ -150,8 +173,9 @@ class Trap(Concentration):
             # if the sim is steady state and
             # if a trap is not defined in one subdomain
             # add c_t = 0 to the form in this subdomain
+            trap_materials = set(self.materials)
             for mat in materials:
-                if mat not in self.materials:
+                if mat not in trap_materials:
                     F_trapping += solution * test_function * dx(mat.id)
 
         for i, mat in enumerate(self.materials):
@@ -20,26 +20,47 @@ class Traps(list):
         self.extrinsic_formulations = []
         self.sub_expressions = []
 
+        self._index_from_id = None
+        self._extrinsic_traps = None
+
     def __setitem__(self, index, item):
         super().__setitem__(index, self._validate_trap(item))
+        self._invalidate_caches()
 
     def insert(self, index, item):
         super().insert(index, self._validate_trap(item))
+        self._invalidate_caches()
 
     def append(self, item):
         super().append(self._validate_trap(item))
+        self._invalidate_caches()
 
     def extend(self, other):
         if isinstance(other, type(self)):
             super().extend(other)
         else:
             super().extend(self._validate_trap(item) for item in other)
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """Invalidates the cached trap index and extrinsic trap list"""
+        self._index_from_id = None
+        self._extrinsic_traps = None
 
     def _validate_trap(self, value):
         if isinstance(value, festim.Trap):
             return value
         raise TypeError("festim.Traps must be a list of festim.Trap")
 
+    def _build_index(self):
+        """Builds the {id: trap} lookup table so that traps can be retrieved
+        in constant time instead of scanning the whole list at each query
+        """
+        index = {}
+        for trap in self:
+            index.setdefault(trap.id, trap)
+        self._index_from_id = index
+
     def make_traps_materials(self, materials):
         for trap in self:
             trap.make_materials(materials)
@@ -48,27 +69,45 @@ class Traps(list):
         for i, trap in enumerate(self, 1):
             if trap.id is None:
                 trap.id = i
+        self._index_from_id = None
+
+    @property
+    def extrinsic_traps(self):
+        """The traps that are of type festim.ExtrinsicTrapBase. The list is
+        cached so the isinstance scan isn't repeated at every timestep"""
+        if self._extrinsic_traps is None:
+            self._extrinsic_traps = [
+                trap for trap in self if isinstance(trap, festim.ExtrinsicTrapBase)
+            ]
+        return self._extrinsic_traps
 
     def create_forms(self, mobile, materials, T, dx, dt=None):
         self.F = 0
+        # reset the expressions so that rebuilding the forms doesn't
+        # accumulate stale ones
+        self.sub_expressions = []
         for trap in self:
             trap.create_form(mobile, materials, T, dx, dt=dt)
             self.F += trap.F
             self.sub_expressions += trap.sub_expressions
 
     def get_trap(self, id):
-        for trap in self:
-            if trap.id == id:
-                return trap
-        raise ValueError("Couldn't find trap {}".format(id))
+        if self._index_from_id is None:
+            self._build_index()
+        if id not in self._index_from_id:
+            # the ids may have changed since the index was built
+            self._build_index()
+        try:
+            return self._index_from_id[id]
+        except KeyError:
+            raise ValueError("Couldn't find trap {}".format(id))
 
     def initialise_extrinsic_traps(self, V):
         """Add functions to ExtrinsicTrapBase objects for density form"""
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                trap.density = [f.Function(V)]
-                trap.density_test_function = f.TestFunction(V)
-                trap.density_previous_solution = f.project(f.Constant(0), V)
+        for trap in self.extrinsic_traps:
+            trap.density = [f.Function(V)]
+            trap.density_test_function = f.TestFunction(V)
+            trap.density_previous_solution = f.project(f.Constant(0), V)
 
     def define_variational_problem_extrinsic_traps(self, dx, dt, T):
         """
@@ -81,31 +120,27 @@ class Traps(list):
         """
         self.extrinsic_formulations = []
         expressions_extrinsic = []
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                trap.create_form_density(dx, dt, T)
-                self.extrinsic_formulations.append(trap.form_density)
+        for trap in self.extrinsic_traps:
+            trap.create_form_density(dx, dt, T)
+            self.extrinsic_formulations.append(trap.form_density)
         self.sub_expressions.extend(expressions_extrinsic)
 
     def define_newton_solver_extrinsic_traps(self):
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                trap.define_newton_solver()
+        for trap in self.extrinsic_traps:
+            trap.define_newton_solver()
 
     def solve_extrinsic_traps(self):
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                du_t = f.TrialFunction(trap.density[0].function_space())
-                J_t = f.derivative(trap.form_density, trap.density[0], du_t)
-                problem = festim.Problem(J_t, trap.form_density, [])
+        for trap in self.extrinsic_traps:
+            du_t = f.TrialFunction(trap.density[0].function_space())
+            J_t = f.derivative(trap.form_density, trap.density[0], du_t)
+            problem = festim.Problem(J_t, trap.form_density, [])
 
-                f.begin(
-                    "Solving nonlinear variational problem."
-                )  # Add message to fenics logs
-                trap.newton_solver.solve(problem, trap.density[0].vector())
-                f.end()
+            f.begin(
+                "Solving nonlinear variational problem."
+            )  # Add message to fenics logs
+            trap.newton_solver.solve(problem, trap.density[0].vector())
+            f.end()
 
     def update_extrinsic_traps_density(self):
-        for trap in self:
-            if isinstance(trap, festim.ExtrinsicTrapBase):
-                trap.density_previous_solution.assign(trap.density[0])
+        for trap in self.extrinsic_traps:
+            trap.density_previous_solution.assign(trap.density[0])
@@ -106,10 +106,13 @@ class DerivedQuantities(list):
 
     def assign_measures_to_quantities(self, dx, ds):
         self.volume_markers = dx.subdomain_data()
+        # the normal only depends on the mesh, create it once for all
+        # quantities
+        n = f.FacetNormal(dx.subdomain_data().mesh())
         for quantity in self:
             quantity.dx = dx
             quantity.ds = ds
-            quantity.n = f.FacetNormal(dx.subdomain_data().mesh())
+            quantity.n = n
 
     def assign_properties_to_quantities(self, materials):
         """Assign properties attributes to all DerivedQuantity objects
@@ -125,6 +128,10 @@ class DerivedQuantities(list):
             quantity.Q = materials.Q
 
     def compute(self, t):
+        # check if first time writing data
+        if self and not self.data:
+            self.data = [self.make_header()]
+
         row = [t]
         for quantity in self:
             if isinstance(quantity, (MaximumVolume, MinimumVolume)):
@@ -132,10 +139,6 @@ class DerivedQuantities(list):
             else:
                 value = quantity.compute()
 
-            # check if first time writing data
-            if len(self.data) == 0:
-                self.data = [self.make_header()]
-
             quantity.data.append(value)
             quantity.t.append(t)
             row.append(value)
@@ -46,6 +46,7 @@ class XDMFExport(Export):
             raise TypeError("checkpoint must be a bool")
 
         self.append = False
+        self._checkpoint_checked = False
 
     @property
     def label(self):
@@ -54,7 +55,7 @@ class XDMFExport(Export):
     @label.setter
     def label(self, value):
         if value is None:
-            if self.field in field_to_label.keys():
+            if self.field in field_to_label:
                 self._label = field_to_label[self.field]
             elif self.field.isdigit():
                 self._label = field_to_label["trap"].replace("i", self.field, 1)
@@ -124,12 +125,16 @@ class XDMFExport(Export):
 
         if self.checkpoint:
             # warn users if checkpoint is True and 1D
-            dimension = self.function.function_space().mesh().topology().dim()
-            if dimension == 1:
-                msg = "in 1D, checkpoint needs to be set to False to "
-                msg += "visualise the XDMF file in Paraview (see issue "
-                msg += "https://github.com/festim-dev/festim/issues/134)"
-                warnings.warn(msg)
+            # the mesh dimension doesn't change between writes, only check
+            # (and build the message) on the first call
+            if not self._checkpoint_checked:
+                dimension = self.function.function_space().mesh().topology().dim()
+                if dimension == 1:
+                    msg = "in 1D, checkpoint needs to be set to False to "
+                    msg += "visualise the XDMF file in Paraview (see issue "
+                    msg += "https://github.com/festim-dev/festim/issues/134)"
+                    warnings.warn(msg)
+                self._checkpoint_checked = True
 
             self.file.write_checkpoint(
                 self.function,
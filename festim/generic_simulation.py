@@ -562,8 +562,8 @@ class Simulation:
             0: self.mobile.post_processing_solution,
             "T": self.T.T,
             "retention": sum(
-                [self.mobile.post_processing_solution]
-                + [trap.post_processing_solution for trap in self.traps]
+                (trap.post_processing_solution for trap in self.traps),
+                self.mobile.post_processing_solution,
             ),
             # dictionary {"post_processing_solutions": bc.post_processing_solutions, "surfaces": bc.surfaces}
             # for each SurfaceKinetics boundary condition
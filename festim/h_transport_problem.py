@@ -123,7 +123,7 @@ class HTransportProblem:
         nb_traps = len(self.traps)
 
         # the number of surfaces where SurfaceKinetics is used
-        nb_adsorbed = sum([len(bc.surfaces) for bc in self._all_surf_kinetics])
+        nb_adsorbed = sum(len(bc.surfaces) for bc in self._all_surf_kinetics)
 
         if nb_traps == 0 and nb_adsorbed == 0:
             V = FunctionSpace(mesh.mesh, element_solute, order_solute)
@@ -158,11 +158,10 @@ class HTransportProblem:
             self.mobile.previous_solution = self.u_n
             self.mobile.test_function = self.v
         else:
-            conc_list = [self.mobile]
-            if self.traps:
-                conc_list += [*self.traps]
-            if len(self._all_surf_kinetics) > 0:
-                conc_list += self._all_surf_kinetics
+            conc_list = [self.mobile, *self.traps, *self._all_surf_kinetics]
+
+            # split the test function once for all concentrations
+            test_functions = split(self.v)
 
             index = 0
             for concentration in conc_list:
@@ -171,12 +170,12 @@ class HTransportProblem:
                     for i in range(len(concentration.surfaces)):
                         concentration.solutions[i] = self.u.sub(index)
                         concentration.previous_solutions[i] = self.u_n.sub(index)
-                        concentration.test_functions[i] = list(split(self.v))[index]
+                        concentration.test_functions[i] = test_functions[index]
                         index += 1
                 else:
                     concentration.solution = self.u.sub(index)
                     concentration.previous_solution = self.u_n.sub(index)
-                    concentration.test_function = list(split(self.v))[index]
+                    concentration.test_function = test_functions[index]
                     index += 1
 
         festim.festim_print("Defining initial values")
@@ -28,17 +28,21 @@ def as_expression(expr):
 
 
 def as_constant(constant):
-    if isinstance(constant, Constant):
-        return constant
-    elif isinstance(constant, (int, float)):
+    # test the common (and cheap) int/float case before walking the
+    # fenics class hierarchy
+    if isinstance(constant, (int, float)):
         return Constant(constant)
+    elif isinstance(constant, Constant):
+        return constant
 
 
 def as_constant_or_expression(val):
-    if isinstance(val, (Constant, Expression, UserExpression)):
-        return val
-    elif isinstance(val, (int, float)):
+    # test the common (and cheap) int/float case before walking the
+    # fenics class hierarchy
+    if isinstance(val, (int, float)):
         return Constant(val)
+    elif isinstance(val, (Constant, Expression, UserExpression)):
+        return val
     else:
         expr_ccode = sp.printing.ccode(val)
         return Expression(expr_ccode, degree=2, t=0)
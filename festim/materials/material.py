@@ -37,6 +37,24 @@ class Material:
         )
     """
 
+    # materials have a small fixed set of attributes and are looked up from
+    # per-cell evaluation loops: __slots__ keeps the instances compact and
+    # makes attribute access a direct slot load
+    __slots__ = (
+        "id",
+        "name",
+        "D_0",
+        "E_D",
+        "S_0",
+        "E_S",
+        "thermal_cond",
+        "heat_capacity",
+        "rho",
+        "borders",
+        "Q",
+        "solubility_law",
+    )
+
     def __init__(
         self,
         id,
@@ -28,26 +28,56 @@ class Materials(list):
         self.density = None
         self.Q = None
 
+        self._index_from_id = None
+        self._index_from_name = None
+
     def __setitem__(self, index, item):
         super().__setitem__(index, self._validate_material(item))
+        self._invalidate_indexes()
 
     def insert(self, index, item):
         super().insert(index, self._validate_material(item))
+        self._invalidate_indexes()
 
     def append(self, item):
         super().append(self._validate_material(item))
+        self._invalidate_indexes()
 
     def extend(self, other):
         if isinstance(other, type(self)):
             super().extend(other)
         else:
             super().extend(self._validate_material(item) for item in other)
+        self._invalidate_indexes()
 
     def _validate_material(self, value):
         if isinstance(value, festim.Material):
             return value
         raise TypeError("festim.Materials must be a list of festim.Material")
 
+    def _invalidate_indexes(self):
+        """Invalidates the cached material lookup tables"""
+        self._index_from_id = None
+        self._index_from_name = None
+
+    def _build_indexes(self):
+        """Builds the {id: material} and {name: material} lookup tables so
+        that materials can be retrieved in constant time instead of scanning
+        the whole list at each query
+        """
+        index_from_id = {}
+        index_from_name = {}
+        for material in self:
+            mat_ids = material.id
+            if type(mat_ids) is not list:
+                mat_ids = [mat_ids]
+            for mat_id in mat_ids:
+                index_from_id.setdefault(mat_id, material)
+            if material.name is not None:
+                index_from_name.setdefault(material.name, material)
+        self._index_from_id = index_from_id
+        self._index_from_name = index_from_name
+
     def check_borders(self, size):
         """Checks that the borders of the materials match
 
@@ -197,13 +227,15 @@ class Materials(list):
         Returns:
             festim.Material: the material that has the id mat_id
         """
-        for material in self:
-            mat_ids = material.id
-            if type(mat_ids) is not list:
-                mat_ids = [mat_ids]
-            if mat_id in mat_ids:
-                return material
-        raise ValueError("Couldn't find ID " + str(mat_id) + " in materials list")
+        if self._index_from_id is None:
+            self._build_indexes()
+        if mat_id not in self._index_from_id:
+            # the ids may have changed since the indexes were built
+            self._build_indexes()
+        try:
+            return self._index_from_id[mat_id]
+        except KeyError:
+            raise ValueError("Couldn't find ID " + str(mat_id) + " in materials list")
 
     def find_material_from_name(self, name):
         """Returns the material with the correct name
@@ -217,12 +249,16 @@ class Materials(list):
         Returns:
             festim.Material: the material object
         """
-        for material in self:
-            if material.name == name:
-                return material
-
-        msg = "No material with name {} was found".format(name)
-        raise ValueError(msg)
+        if self._index_from_name is None:
+            self._build_indexes()
+        if name not in self._index_from_name:
+            # the names may have changed since the indexes were built
+            self._build_indexes()
+        try:
+            return self._index_from_name[name]
+        except KeyError:
+            msg = "No material with name {} was found".format(name)
+            raise ValueError(msg)
 
     def find_material(self, mat: Union[int, str, Material]):
         """Returns the correct festim.Material object based on either an id,
@@ -349,17 +385,25 @@ class ArheniusCoeff(f.UserExpression):
     def __init__(self, materials, vm, T, pre_exp, E, **kwargs):
         super().__init__(kwargs)
         self._vm = vm
+        self._mesh = vm.mesh()
         self._T = T
         self._materials = materials
         self._pre_exp = pre_exp
         self._E = E
+        # the properties of a subdomain don't change between cells, cache
+        # them per subdomain id instead of fetching them at every call
+        self._prms_from_id = {}
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._vm.mesh(), ufc_cell.index)
+        cell = f.Cell(self._mesh, ufc_cell.index)
         subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
-        D_0 = getattr(material, self._pre_exp)
-        E_D = getattr(material, self._E)
+        try:
+            D_0, E_D = self._prms_from_id[subdomain_id]
+        except KeyError:
+            material = self._materials.find_material_from_id(subdomain_id)
+            D_0 = getattr(material, self._pre_exp)
+            E_D = getattr(material, self._E)
+            self._prms_from_id[subdomain_id] = (D_0, E_D)
         value[0] = D_0 * f.exp(-E_D / k_B / self._T(x))
 
     def value_shape(self):
@@ -371,15 +415,24 @@ class ThermalProp(f.UserExpression):
         super().__init__(kwargs)
         self._T = T
         self._vm = vm
+        self._mesh = vm.mesh()
         self._materials = materials
         self._key = key
+        # the property of a subdomain doesn't change between cells, cache
+        # it (and whether it is a function of T) per subdomain id
+        self._prms_from_id = {}
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._vm.mesh(), ufc_cell.index)
+        cell = f.Cell(self._mesh, ufc_cell.index)
         subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
-        attribute = getattr(material, self._key)
-        if callable(attribute):
+        try:
+            attribute, is_callable = self._prms_from_id[subdomain_id]
+        except KeyError:
+            material = self._materials.find_material_from_id(subdomain_id)
+            attribute = getattr(material, self._key)
+            is_callable = callable(attribute)
+            self._prms_from_id[subdomain_id] = (attribute, is_callable)
+        if is_callable:
             value[0] = attribute(self._T(x))
         else:
             value[0] = attribute
@@ -39,14 +39,13 @@ class Mesh1D(Mesh):
             "size_t", self.mesh, self.mesh.topology().dim() - 1, 0
         )
         surface_markers.set_all(0)
-        i = 0
+        # only the two boundary facets need to be written, the interior
+        # facets are already marked 0 by set_all
         for facet in f.facets(self.mesh):
-            i += 1
-            x0 = facet.midpoint()
-            surface_markers[facet] = 0
-            if f.near(x0.x(), self.start):
+            x0 = facet.midpoint().x()
+            if f.near(x0, self.start):
                 surface_markers[facet] = 1
-            if f.near(x0.x(), self.size):
+            if f.near(x0, self.size):
                 surface_markers[facet] = 2
         return surface_markers
 
@@ -63,11 +62,30 @@ class Mesh1D(Mesh):
         volume_markers = f.MeshFunction(
             "size_t", self.mesh, self.mesh.topology().dim(), 0
         )
-        # iterate through the cells of the mesh and mark them
-        for cell in f.cells(self.mesh):
-            x = cell.midpoint().x()
-            subdomain_id = materials.find_subdomain_from_x_coordinate(x)
-            volume_markers[cell] = subdomain_id
+        # gather the cell midpoints in one array and attribute the subdomain
+        # ids with vectorised masks instead of one python-level
+        # find_subdomain_from_x_coordinate call per cell
+        midpoints = self.mesh.coordinates()[self.mesh.cells(), 0].mean(axis=1)
+        markers = volume_markers.array()
+        # iterate in reverse so that, as in find_subdomain_from_x_coordinate,
+        # the first matching material (and border set) in the list wins
+        for material in reversed(materials):
+            # if no borders are provided, assume only one subdomain
+            if material.borders is None:
+                markers[:] = material.id
+                continue
+            if isinstance(material.borders[0], list) and len(material.borders) > 1:
+                list_of_borders = material.borders
+            else:
+                list_of_borders = [material.borders]
+            if isinstance(material.id, list):
+                subdomains = material.id
+            else:
+                subdomains = [material.id for _ in range(len(list_of_borders))]
+
+            for borders, subdomain in reversed(list(zip(list_of_borders, subdomains))):
+                inside = (midpoints >= borders[0]) & (midpoints <= borders[1])
+                markers[inside] = subdomain
 
         return volume_markers
 
@@ -90,6 +90,10 @@ class Stepsize:
             nb_it (int): number of iterations the solver required to converge.
             converged (bool): True if the solver converged, else False.
         """
+        # evaluate the fenics.Constant once and work on a local float, the
+        # new stepsize is assigned back in one go at the end
+        new_value = float(self.value)
+
         if self.adaptive_stepsize:
             change_ratio = self.adaptive_stepsize["stepsize_change_ratio"]
             dt_min = self.adaptive_stepsize["dt_min"]
@@ -99,27 +103,29 @@ class Stepsize:
                 if dt_min is None:
                     raise ValueError("Solver diverged but dt_min is not set.")
 
-                self.value.assign(float(self.value) / change_ratio)
-                if float(self.value) < dt_min:
+                new_value /= change_ratio
+                if new_value < dt_min:
                     raise ValueError("stepsize reached minimal value")
             if nb_it < 5:
-                self.value.assign(float(self.value) * change_ratio)
+                new_value *= change_ratio
             else:
-                self.value.assign(float(self.value) / change_ratio)
+                new_value /= change_ratio
 
             if callable(max_stepsize):
                 max_stepsize = max_stepsize(t)
             if max_stepsize is not None:
-                if float(self.value) > max_stepsize:
-                    self.value.assign(max_stepsize)
+                if new_value > max_stepsize:
+                    new_value = max_stepsize
 
         # adapt for next milestone
         next_milestone = self.next_milestone(t)
         if next_milestone is not None:
-            if t + float(self.value) > next_milestone and not np.isclose(
+            if t + new_value > next_milestone and not np.isclose(
                 t, next_milestone, atol=0
             ):
-                self.value.assign((next_milestone - t))
+                new_value = next_milestone - t
+
+        self.value.assign(new_value)
 
     def next_milestone(self, current_time: float):
         """Returns the next milestone that the simulation must pass.
@@ -133,7 +139,5 @@ class Stepsize:
         """
         if self.milestones is None:
             return None
-        for milestone in self.milestones:
-            if current_time < milestone:
-                return milestone
-        return None
+        # milestones are sorted: return the first one ahead of current_time
+        return next((m for m in self.milestones if current_time < m), None)
@@ -42,6 +42,18 @@ def test_find_material_from_id_unfound_id():
         my_Mats.find_material_from_id(id_test)
 
 
+def test_find_material_from_id_after_mutation():
+    """Checks that find_material_from_id() stays in sync with the list when
+    materials are added after a first lookup
+    """
+    mat_1 = F.Material(id=1, D_0=None, E_D=None)
+    mat_2 = F.Material(id=2, D_0=None, E_D=None)
+    my_Mats = F.Materials([mat_1])
+    assert my_Mats.find_material_from_id(1) == mat_1
+    my_Mats.append(mat_2)
+    assert my_Mats.find_material_from_id(2) == mat_2
+
+
 def test_find_material_from_name():
     """Checks the function find_material_from_name() returns the correct material"""
     mat_1 = F.Material(id=1, D_0=None, E_D=None, name="mat1")
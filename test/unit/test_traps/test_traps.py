@@ -119,6 +119,17 @@ class TestGetTrap:
         with pytest.raises(ValueError, match="Couldn't find trap {}".format(id)):
             self.my_traps.get_trap(id=id)
 
+    def test_trap_is_found_after_assign_traps_ids(self):
+        """Checks that get_trap stays in sync when ids are assigned after a
+        first lookup"""
+        trap3 = festim.Trap(
+            k_0=1, E_k=2, p_0=1, E_p=2, materials="mat_name", density=1
+        )
+        my_traps = festim.Traps([self.trap1, trap3])
+        assert my_traps.get_trap(id=1) == self.trap1
+        my_traps.assign_traps_ids()
+        assert my_traps.get_trap(id=2) == trap3
+
 
 class TestTrapsMethods:
     """Checks that festim.Traps methods work properly"""